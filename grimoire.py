@@ -22,6 +22,9 @@ import sys
 import shutil
 import json
 import argparse
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -31,11 +34,58 @@ import html
 import markdown
 import yaml
 
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Minimum number of changed files before conversion is spread over worker processes
+PARALLEL_MIN_FILES = 32
+
+# Shared JSON-LD encoder (json.dumps builds a new encoder on every call)
+# Compact output: structured data is machine-read, indentation only adds bytes
+JSON_LD_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+# Placeholder for the '../' link prefix in cached navigation HTML
+# (NUL cannot occur in file names, so it never collides with a page URL)
+NAV_PREFIX = '\0'
+
+# Placeholders in the SEO page description template (substituted in one pass)
+SEO_PLACEHOLDER_RE = re.compile(r'\{(title|category|site_name)\}')
+
+# Indentation of footer lines inside the footer-bottom block
+FOOTER_INDENT = ' ' * 16
+FOOTER_LINE_SEPARATOR = '\n' + FOOTER_INDENT
+
+# Separator before each breadcrumb level (and the page title)
+BREADCRUMB_SEPARATOR = '''<span class="breadcrumb-separator">›</span>
+                    '''
+
+# First H1 in markdown
+TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+# Links to .md files (rewritten to .html)
+MD_LINK_RE = re.compile(r'href="([^"]+)\.md"')
+
+# Prism.js language classes remapped for better compatibility (single regex pass)
+PRISM_LANGUAGE_MAPPINGS = {
+    'language-http': 'language-none',
+    'language-plaintext': 'language-none',
+}
+PRISM_CLASS_RE = re.compile('class="(' + '|'.join(map(re.escape, PRISM_LANGUAGE_MAPPINGS)) + ')"')
+
 
 # =============================================================================
 # DISPLAY NAME HANDLING
 # =============================================================================
 
+# Match: digits followed by any combo of dash, underscore, dot, space
+NUMBER_PREFIX_RE = re.compile(r'^\d+[\-_.\s]+')
+
+# Hyphens/underscores -> spaces in a single pass
+SEPARATOR_TABLE = str.maketrans('-_', '  ')
+
+# Shared default for acronyms / lowercase_words (avoids allocating a set per call)
+EMPTY_WORDS = frozenset()
+
 
 def strip_number_prefix(name: str) -> str:
     """
@@ -46,20 +96,19 @@ def strip_number_prefix(name: str) -> str:
         '03. Reference' -> 'Reference'
         '04 - Notes' -> 'Notes'
     """
-    # Match: digits followed by any combo of dash, underscore, dot, space
-    return re.sub(r'^\d+[\-_.\s]+', '', name)
+    return NUMBER_PREFIX_RE.sub('', name)
 
 
-def capitalize_with_acronyms(text: str, acronyms: set = None, lowercase_words: set = None) -> str:
+def capitalize_with_acronyms(text: str, acronyms: frozenset = None, lowercase_words: frozenset = None) -> str:
     """
     Capitalize text with proper handling of acronyms and lowercase words.
     'api testing' -> 'API Testing' (if 'api' in acronyms)
     'rules of engagement' -> 'Rules of Engagement' (if 'of' in lowercase_words)
     """
     if acronyms is None:
-        acronyms = set()
+        acronyms = EMPTY_WORDS
     if lowercase_words is None:
-        lowercase_words = set()
+        lowercase_words = EMPTY_WORDS
     words = text.split()
     result = []
     
@@ -84,8 +133,8 @@ def capitalize_with_acronyms(text: str, acronyms: set = None, lowercase_words: s
     return " ".join(result)
 
 
-def format_display_name(name: str, strip_prefix: bool = True, acronyms: set = None, 
-                        overrides: dict = None, lowercase_words: set = None) -> str:
+def format_display_name(name: str, strip_prefix: bool = True, acronyms: frozenset = None, 
+                        overrides: dict = None, lowercase_words: frozenset = None) -> str:
     """
     Convert a folder/file name to a human-readable display name.
     
@@ -100,8 +149,10 @@ def format_display_name(name: str, strip_prefix: bool = True, acronyms: set = No
     if not strip_prefix:
         return name
     
-    if overrides is None:
-        overrides = {}
+    # No overrides configured (the default): skip both lookups
+    if not overrides:
+        display = strip_number_prefix(name).translate(SEPARATOR_TABLE)
+        return capitalize_with_acronyms(display, acronyms, lowercase_words)
     
     # Check overrides first (before stripping numbers)
     if name in overrides:
@@ -115,10 +166,113 @@ def format_display_name(name: str, strip_prefix: bool = True, acronyms: set = No
         return overrides[stripped]
     
     # Convert hyphens/underscores to spaces and capitalize with acronyms
-    display = stripped.replace('-', ' ').replace('_', ' ')
+    display = stripped.translate(SEPARATOR_TABLE)
     return capitalize_with_acronyms(display, acronyms, lowercase_words)
 
 
+# =============================================================================
+# FILE HELPERS
+# =============================================================================
+
+
+# Any letter or digit (Unicode-aware, same characters as str.isalnum)
+ALNUM_RE = re.compile(r'[^\W_]')
+
+# Folders skipped while scanning when the config does not list its own
+DEFAULT_EXCLUSIONS = ('.trash', '.obsidian', '.git', '__pycache__', 'node_modules')
+
+
+def is_valid_name(name: str) -> bool:
+    """Check if a name is valid (not just separators/special chars)"""
+    # Remove extension if present
+    name_without_ext = name.rsplit('.', 1)[0]
+    # Strip common separator characters
+    stripped = name_without_ext.strip('-_=. ')
+    # Must have at least some alphanumeric content
+    return ALNUM_RE.search(stripped) is not None
+
+
+def read_markdown_file(file_path: Path) -> str:
+    """
+    Read a UTF-8 markdown file.
+    Reads bytes and decodes once (faster than text-mode reads for many small
+    files), normalizing line endings the same way text mode does.
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def copy_asset(src: Path, dst: Path):
+    """
+    Copy a static asset into the output folder.
+    Hardlinks when possible (metadata-only, and a no-op when a previous build
+    already linked the same file), falling back to a regular copy across
+    filesystems or where hardlinks are not supported. A copy left by a previous
+    build (copy2 keeps the mtime) is skipped when its size and mtime still match.
+    """
+    try:
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            dst_stat = None
+        if dst_stat is not None:
+            src_stat = os.stat(src)
+            if os.path.samestat(src_stat, dst_stat):
+                return
+            if (src_stat.st_size, src_stat.st_mtime_ns) == (dst_stat.st_size, dst_stat.st_mtime_ns):
+                return
+            dst.unlink()
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def build_cache_dir(output_dir: Path, project_dir: Path = None) -> Path:
+    """
+    Cache folder for one output folder, under the project's .grimoire-cache/.
+    The project is the config file's folder (CWD by default). When the project
+    is the output folder itself (--output .), the user cache folder is used so
+    the cache is never deployed.
+    """
+    output_dir = Path(output_dir).resolve()
+    project_dir = Path(project_dir or Path.cwd()).resolve()
+    if project_dir == output_dir or output_dir in project_dir.parents:
+        base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'grimoire'
+    else:
+        base = project_dir / '.grimoire-cache'
+    # Keyed on the full output path: outputs with the same name never share a cache
+    key = hashlib.sha1(str(output_dir).encode('utf-8')).hexdigest()[:12]
+    return base / f'{output_dir.name}-{key}'
+
+
+# =============================================================================
+# TEMPLATE HELPERS
+# =============================================================================
+
+# {{PLACEHOLDER}} markers (capturing, so split() keeps them at odd indexes)
+TEMPLATE_PLACEHOLDER_RE = re.compile(r'(\{\{[A-Z_]+\}\})')
+
+
+def split_template(template: str) -> List[str]:
+    """Split a template once into alternating literal text and {{PLACEHOLDER}} markers"""
+    return TEMPLATE_PLACEHOLDER_RE.split(template)
+
+
+def fill_template(template_parts: List[str], replacements: Dict[str, str]) -> str:
+    """
+    Fill a split template in a single pass.
+    Substituted values are never rescanned, so placeholder text inside page
+    content is kept as written. Unknown placeholders are left untouched.
+    """
+    filled = template_parts[:]
+    for i in range(1, len(filled), 2):
+        filled[i] = replacements.get(filled[i], filled[i])
+    return ''.join(filled)
+
+
 # =============================================================================
 # MAIN CONVERTER CLASS
 # =============================================================================
@@ -142,7 +296,8 @@ class MarkdownToHtmlConverter:
         categories: Mapping of category names to their pages
     """
     
-    def __init__(self, site_name='Documentation', description='Documentation Platform', output_dir='output'):
+    def __init__(self, site_name='Documentation', description='Documentation Platform', output_dir='output',
+                 project_dir=None):
         self.site_name = site_name
         self.description = description
         self.output_dir = Path(output_dir)
@@ -150,14 +305,61 @@ class MarkdownToHtmlConverter:
         self.categories = {}
         self.config = {}
         self.site_url = ''
+        self.prepare_config()
+        # Single timestamp for everything a build stamps (footer, sitemap lastmod)
+        self.build_time = datetime.now()
+        # Whether the loaded template has a {{JSON_LD}} slot (skip building it otherwise)
+        self.template_uses_json_ld = True
+        
+        # Display names memoized per build (folder names recur for every page)
+        self._display_names = {}
+        # Category icons memoized per build (looked up for every nav section and card)
+        self._category_icons = {}
+        # Rendered navigation (with NAV_PREFIX placeholders), built once per build
+        self._navigation_html = None
+        # Navigation with the link prefix applied, per folder depth
+        self._navigation_by_depth = {}
+        # Relative links to site-wide files, per folder depth
+        self._depth_urls = {}
+        # Contribute button / footer link HTML, per folder depth
+        self._contribute_by_depth = {}
         
         # Initialize markdown converter
-        self.md = markdown.Markdown(extensions=[
-            'extra',
-            'fenced_code',
-            'tables',
-            'toc'
-        ])
+        extensions = ['extra', 'fenced_code', 'tables', 'toc']
+        self.md = markdown.Markdown(extensions=extensions)
+        
+        # Build caches, kept in the project (never next to or inside the output folder)
+        self.project_dir = project_dir
+        self.cache_dir = build_cache_dir(self.output_dir, project_dir)
+        # Rendered Markdown, keyed on content + renderer (entries no page uses are pruned per build)
+        self.html_cache_dir = self.cache_dir / 'html'
+        self._used_render_keys = set()
+        self.page_cache_file = self.cache_dir / 'pages.json'
+        # Hashes of files written by the last build (identical outputs are not rewritten)
+        self.output_hashes_file = self.cache_dir / 'outputs.json'
+        self._previous_outputs = {}
+        self._written_outputs = {}
+        self._unchanged_outputs = 0
+        self.page_render_signature = ''
+        self.render_signature = f"markdown-{markdown.__version__}:{','.join(extensions)}\n"
+        # Hash of this script: cached page data and rendered pages are invalid after an upgrade
+        self.generator_hash = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+    
+    def prepare_config(self):
+        """
+        Cache settings read on every page render (config is fixed during a build).
+        Called from __init__ for defaults and again at the start of each build.
+        """
+        ui_config = self.config.get('ui', {})
+        # HTML-escaped copies of the site strings
+        self.site_name_html = html.escape(self.site_name)
+        self.description_html = html.escape(self.description)
+        self.github_url = self.config.get('site', {}).get('github_url', '#')
+        self.seo_config = self.config.get('seo', {})
+        self.use_cache = self.config.get('generator', {}).get('build_cache', True)
+        self.show_contribute = ui_config.get('show_contribute', True)
+        self.contribute_text_html = html.escape(ui_config.get('contribute_text', 'Contribute'))
+        self.contribute_url = ui_config.get('contribute_url', './contribute.html')
     
     @property
     def strip_prefix(self) -> bool:
@@ -165,9 +367,10 @@ class MarkdownToHtmlConverter:
         return self.config.get('ui', {}).get('strip_number_prefix', True)
     
     @property
-    def acronyms(self) -> set:
-        """Get acronyms set from config"""
-        return set(self.config.get('formatting', {}).get('acronyms', []))
+    def acronyms(self) -> frozenset:
+        """Get acronyms set from config (lowercased and interned, matched against word.lower())"""
+        configured = self.config.get('formatting', {}).get('acronyms', [])
+        return frozenset(sys.intern(word.lower()) for word in configured)
     
     @property
     def display_overrides(self) -> dict:
@@ -175,10 +378,10 @@ class MarkdownToHtmlConverter:
         return self.config.get('formatting', {}).get('display_name_overrides', {})
     
     @property
-    def lowercase_words(self) -> set:
+    def lowercase_words(self) -> frozenset:
         """Get lowercase words set from config (words to keep lowercase unless first word)"""
         configured = self.config.get('formatting', {}).get('lowercase_words', [])
-        return set(configured)
+        return frozenset(sys.intern(word.lower()) for word in configured)
     
     @property
     def pin_to_top(self) -> list:
@@ -204,7 +407,7 @@ class MarkdownToHtmlConverter:
     
     def generate_meta_description(self, page: Dict[str, Any] = None, page_type: str = 'content') -> str:
         """Generate meta description for SEO"""
-        seo_config = self.config.get('seo', {})
+        seo_config = self.seo_config
         
         if page_type == 'index':
             template = seo_config.get('index_description', 
@@ -226,14 +429,14 @@ class MarkdownToHtmlConverter:
             # Use deepest level as category, or first level, or 'General'
             category = levels[-1] if levels else 'General'
             
-            return template.replace('{title}', title).replace(
-                '{category}', category).replace('{site_name}', self.site_name)[:160]
+            values = {'title': title, 'category': category, 'site_name': self.site_name}
+            return SEO_PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], template)[:160]
         
         return self.description[:160]
     
     def generate_meta_keywords(self, page: Dict[str, Any] = None, page_type: str = 'content') -> str:
         """Generate meta keywords"""
-        seo_config = self.config.get('seo', {})
+        seo_config = self.seo_config
         # Use single 'keywords' field (fallback to old fields for backward compatibility)
         base_keywords = seo_config.get('keywords', seo_config.get('base_keywords', 'documentation, guides, tutorials'))
         
@@ -263,8 +466,9 @@ class MarkdownToHtmlConverter:
         base_url = self.site_url.rstrip('/')
         return f"{base_url}/assets/img/og-image.jpg"
     
-    def generate_json_ld(self, page: Dict[str, Any] = None, page_type: str = 'content', page_url: str = '') -> str:
-        """Generate JSON-LD structured data"""
+    def generate_json_ld(self, page: Dict[str, Any] = None, page_type: str = 'content', page_url: str = '',
+                         canonical: str = None, description: str = None) -> str:
+        """Generate JSON-LD structured data (canonical/description reused when already computed)"""
         base_url = self.site_url.rstrip('/')
         
         if page_type == 'index':
@@ -281,12 +485,15 @@ class MarkdownToHtmlConverter:
                 }
             }
         else:
-            canonical = self.generate_canonical_url(page_url)
+            if canonical is None:
+                canonical = self.generate_canonical_url(page_url)
+            if description is None:
+                description = self.generate_meta_description(page, page_type)
             json_ld = {
                 "@context": "https://schema.org",
                 "@type": "TechArticle",
                 "headline": page.get('title', 'Article') if page else 'Article',
-                "description": self.generate_meta_description(page, page_type),
+                "description": description,
                 "url": canonical,
                 "author": {
                     "@type": "Organization",
@@ -309,48 +516,38 @@ class MarkdownToHtmlConverter:
             if page and page.get('levels'):
                 json_ld["articleSection"] = page['levels'][0]
         
-        return f'<script type="application/ld+json">\n{json.dumps(json_ld, indent=2)}\n</script>'
+        return f'<script type="application/ld+json">\n{JSON_LD_ENCODER.encode(json_ld)}\n</script>'
     
-    def generate_sitemap(self) -> str:
-        """Generate sitemap.xml content"""
+    def write_sitemap(self, f):
+        """Write sitemap.xml content to an open file, one <url> entry at a time"""
         base_url = self.site_url.rstrip('/')
-        today = datetime.now().strftime('%Y-%m-%d')
+        today = self.build_time.strftime('%Y-%m-%d')
+        
+        def write_url(loc: str, changefreq: str, priority: str):
+            f.write(f'''  <url>
+    <loc>{loc}</loc>
+    <lastmod>{today}</lastmod>
+    <changefreq>{changefreq}</changefreq>
+    <priority>{priority}</priority>
+  </url>
+''')
         
-        urls = []
+        f.write('''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+''')
         
         # Homepage
-        urls.append(f'''  <url>
-    <loc>{base_url}/</loc>
-    <lastmod>{today}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>1.0</priority>
-  </url>''')
+        write_url(f'{base_url}/', 'weekly', '1.0')
         
         # Static pages
         for static_page in ['about.html', 'contribute.html']:
-            urls.append(f'''  <url>
-    <loc>{base_url}/{static_page}</loc>
-    <lastmod>{today}</lastmod>
-    <changefreq>monthly</changefreq>
-    <priority>0.8</priority>
-  </url>''')
+            write_url(f'{base_url}/{static_page}', 'monthly', '0.8')
         
         # Content pages
         for page in self.all_pages:
-            page_url = page['url']
-            urls.append(f'''  <url>
-    <loc>{base_url}/{page_url}</loc>
-    <lastmod>{today}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.7</priority>
-  </url>''')
-        
-        sitemap = f'''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{chr(10).join(urls)}
-</urlset>'''
+            write_url(f"{base_url}/{page['url']}", 'weekly', '0.7')
         
-        return sitemap
+        f.write('</urlset>')
     
     def generate_robots_txt(self) -> str:
         """Generate robots.txt content"""
@@ -369,14 +566,18 @@ Crawl-delay: 1
     def get_seo_replacements(self, page: Dict[str, Any] = None, page_type: str = 'content', 
                               page_url: str = '', assets_path: str = 'assets/') -> Dict[str, str]:
         """Get all SEO-related template replacements"""
+        # Shared with the JSON-LD block (computed once per page)
+        description = self.generate_meta_description(page, page_type)
+        canonical = self.generate_canonical_url(page_url)
         return {
             '{{PAGE_TITLE}}': self.generate_page_title(page, page_type),
-            '{{META_DESCRIPTION}}': self.generate_meta_description(page, page_type),
+            '{{META_DESCRIPTION}}': description,
             '{{META_KEYWORDS}}': self.generate_meta_keywords(page, page_type),
-            '{{CANONICAL_URL}}': self.generate_canonical_url(page_url),
+            '{{CANONICAL_URL}}': canonical,
             '{{OG_TITLE}}': page.get('title', self.site_name) if page else self.site_name,
             '{{OG_IMAGE_URL}}': self.generate_og_image_url(assets_path),
-            '{{JSON_LD}}': self.generate_json_ld(page, page_type, page_url)
+            '{{JSON_LD}}': (self.generate_json_ld(page, page_type, page_url, canonical, description)
+                            if self.template_uses_json_ld else '')
         }
     
     def parse_frontmatter(self, content: str) -> tuple[Dict[str, Any], str]:
@@ -385,10 +586,16 @@ Crawl-delay: 1
         # Handle YAML frontmatter (---)
         if content.startswith('---'):
             try:
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    frontmatter = yaml.safe_load(parts[1]) or {}
-                    markdown_content = parts[2].strip()
+                # Locate the closing delimiter and slice (no intermediate parts list)
+                end = content.find('---', 3)
+                if end != -1:
+                    yaml_block = content[3:end]
+                    # Empty block (---\n---): skip the YAML loader entirely
+                    if yaml_block.strip():
+                        frontmatter = yaml.load(yaml_block, Loader=YAML_LOADER) or {}
+                    else:
+                        frontmatter = {}
+                    markdown_content = content[end + 3:].strip()
                     return frontmatter, markdown_content
             except Exception as e:
                 print(f"[!] Frontmatter parsing error: {e}")
@@ -420,26 +627,34 @@ Crawl-delay: 1
     
     def extract_title_from_markdown(self, content: str) -> Optional[str]:
         """Extract title from first H1 in markdown"""
-        match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        match = TITLE_RE.search(content)
         return match.group(1) if match else None
     
+    def get_display_name(self, name: str) -> str:
+        """Format a folder/file name to its display name using config settings (memoized)"""
+        display = self._display_names.get(name)
+        if display is None:
+            display = format_display_name(name, self.strip_prefix, self.acronyms, self.display_overrides, self.lowercase_words)
+            self._display_names[name] = display
+        return display
+    
     def format_category_name(self, name: str) -> str:
         """Format folder name to display name."""
         if not name:
             return ''
-        return format_display_name(name, self.strip_prefix, self.acronyms, self.display_overrides, self.lowercase_words)
+        return self.get_display_name(name)
     
-    def get_page_hierarchy(self, file_path: Path, root_dir: Path) -> Dict[str, Any]:
+    def get_page_hierarchy(self, relative_path: Path) -> Dict[str, Any]:
         """
-        Extract page hierarchy from file path.
+        Extract page hierarchy from file path (relative to the content root).
         Returns levels as arrays for unlimited depth support.
         """
-        relative_path = file_path.relative_to(root_dir)
-        parts = [p for p in relative_path.parts[:-1]]  # All folders except filename
+        # All folders except filename (interned: reused as nav tree and memo keys)
+        parts = [sys.intern(p) for p in relative_path.parts[:-1]]
         
         # Build levels arrays
         levels_raw = parts  # Raw folder names
-        levels = [format_display_name(p, self.strip_prefix, self.acronyms, self.display_overrides, self.lowercase_words) for p in parts]  # Display names
+        levels = [self.get_display_name(p) for p in parts]  # Display names
         
         # Build category string (all levels joined)
         category = ' > '.join(levels) if levels else 'General'
@@ -447,30 +662,51 @@ Crawl-delay: 1
         return {
             'levels_raw': levels_raw,
             'levels': levels,
+            'levels_html': [html.escape(level) for level in levels],  # Escaped once for nav/breadcrumbs
             'category': category,
             'depth': len(levels)
         }
     
-    def generate_page_id(self, file_path: Path, root_dir: Path) -> str:
-        """Generate unique page ID from file path"""
-        relative_path = file_path.relative_to(root_dir)
+    def generate_page_id(self, relative_path: Path) -> str:
+        """Generate unique page ID from file path (relative to the content root)"""
         return str(relative_path.with_suffix('')).replace('/', '-').replace('\\', '-')
     
-    def generate_page_url(self, file_path: Path, root_dir: Path) -> str:
-        """Generate page URL based on file path"""
-        relative_path = file_path.relative_to(root_dir)
+    def generate_page_url(self, relative_path: Path) -> str:
+        """Generate page URL based on file path (relative to the content root)"""
         return str(relative_path.with_suffix('.html')).replace('\\', '/')
     
     def fix_prism_language_classes(self, html_content: str) -> str:
         """Fix Prism.js language classes for better compatibility."""
-        language_mappings = {
-            'language-http': 'language-none',
-            'language-plaintext': 'language-none',
-        }
+        return PRISM_CLASS_RE.sub(lambda m: f'class="{PRISM_LANGUAGE_MAPPINGS[m.group(1)]}"', html_content)
+    
+    def render_cache_key(self, content: str) -> str:
+        """Render cache key for a Markdown body"""
+        return hashlib.sha256((self.render_signature + content).encode('utf-8')).hexdigest()
+    
+    def render_markdown(self, content: str, key: str = None) -> str:
+        """Render a Markdown body to HTML (single entry point for all content, cached)"""
+        if not self.use_cache:
+            return self.md.reset().convert(content)
+        
+        if key is None:
+            key = self.render_cache_key(content)
+        self._used_render_keys.add(key)
+        cache_file = self.html_cache_dir / f'{key}.html'
+        try:
+            return cache_file.read_text(encoding='utf-8')
+        except OSError:
+            pass
         
-        for old_class, new_class in language_mappings.items():
-            html_content = html_content.replace(f'class="{old_class}"', f'class="{new_class}"')
+        # Reset per document: extensions such as footnotes keep state between calls
+        html_content = self.md.reset().convert(content)
         
+        try:
+            # Write to a temp file first so parallel workers never read a partial entry
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(html_content, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"[!] Could not write render cache: {e}")
         return html_content
     
     def calculate_reading_time(self, content: str) -> int:
@@ -481,24 +717,27 @@ Crawl-delay: 1
     def process_markdown_file(self, file_path: Path, root_dir: Path) -> Dict[str, Any]:
         """Process individual markdown file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_markdown_file(file_path)
             
             frontmatter, markdown_content = self.parse_frontmatter(content)
-            hierarchy = self.get_page_hierarchy(file_path, root_dir)
+            # Compute path pieces once; navigation sorts on the stem for every render
+            relative_path = file_path.relative_to(root_dir)
+            stem = file_path.stem
+            hierarchy = self.get_page_hierarchy(relative_path)
             
             title = (
                 frontmatter.get('display_name') or
                 frontmatter.get('title') or
-                format_display_name(file_path.stem, self.strip_prefix, self.acronyms, self.display_overrides, self.lowercase_words)
+                self.get_display_name(stem)
             )
             
-            html_content = self.md.convert(markdown_content)
+            markdown_key = self.render_cache_key(markdown_content)
+            html_content = self.render_markdown(markdown_content, markdown_key)
             html_content = self.fix_prism_language_classes(html_content)
-            html_content = re.sub(r'href="([^"]+)\.md"', r'href="\1.html"', html_content) # Convert .md links to .html links
+            html_content = MD_LINK_RE.sub(r'href="\1.html"', html_content) # Convert .md links to .html links
             
-            page_id = self.generate_page_id(file_path, root_dir)
-            page_url = self.generate_page_url(file_path, root_dir)
+            page_id = self.generate_page_id(relative_path)
+            page_url = self.generate_page_url(relative_path)
             reading_time = self.calculate_reading_time(markdown_content)
             
             icon = frontmatter.get('icon', '')
@@ -507,16 +746,22 @@ Crawl-delay: 1
                 'id': page_id,
                 'url': page_url,
                 'title': title,
+                'title_html': html.escape(title),
                 'icon': icon,
                 'levels_raw': hierarchy['levels_raw'],
                 'levels': hierarchy['levels'],
+                'levels_html': hierarchy['levels_html'],
                 'depth': hierarchy['depth'],
                 'category': hierarchy['category'],
                 'html_content': html_content,
                 'reading_time': reading_time,
-                'file_path': file_path,
-                'relative_path': file_path.relative_to(root_dir),
-                'frontmatter': frontmatter
+                'file_path': str(file_path),
+                'stem': stem,
+                'frontmatter': frontmatter,
+                'markdown_key': markdown_key,
+                # Everything above is derived from the source text and path (plus config/code,
+                # which the page cache and the render signature already cover)
+                'source_hash': hashlib.sha1(f"{file_path}\0{content}".encode('utf-8')).hexdigest(),
             }
             
             return page_data
@@ -525,6 +770,205 @@ Crawl-delay: 1
             print(f"[!] Error processing {file_path}: {e}")
             return None
     
+    # =========================================================================
+    # BUILD CACHE
+    # =========================================================================
+    
+    def page_cache_signature(self, root_dir: Path) -> str:
+        """Hash of everything besides the source files that cached page data depends on"""
+        config_json = json.dumps(self.config, sort_keys=True, default=str)
+        signature = f"{self.generator_hash}\n{root_dir}\n{self.render_signature}{config_json}"
+        return hashlib.sha256(signature.encode('utf-8')).hexdigest()
+    
+    def load_page_cache(self, root_dir: Path) -> Dict[str, tuple]:
+        """Load page data cached by the previous build (empty if missing, stale or disabled)"""
+        if not self.use_cache:
+            return {}
+        # JSON rather than pickle: loading the cache must never run code from the file
+        try:
+            with open(self.page_cache_file, 'r', encoding='utf-8') as f:
+                signature, entries = json.load(f)
+            if signature != self.page_cache_signature(root_dir):
+                return {}
+            return {path: (tuple(stat_key), page_data) for path, (stat_key, page_data) in entries.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[!] Ignoring unreadable page cache: {e}")
+            return {}
+    
+    def save_page_cache(self, root_dir: Path, entries: Dict[str, tuple]):
+        """Persist page data keyed by file path -> ((mtime_ns, size), page_data)"""
+        if not self.use_cache:
+            return
+        cache_file = self.page_cache_file
+        try:
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                # Frontmatter may hold dates or non-string keys: stringify or skip what JSON lacks
+                json.dump([self.page_cache_signature(root_dir), entries], f,
+                          ensure_ascii=False, separators=(',', ':'), default=str, skipkeys=True)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[!] Could not write page cache: {e}")
+    
+    def create_cache_dir(self):
+        """Create the cache folders, readable by the current user only"""
+        try:
+            self.cache_dir.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self.cache_dir.mkdir(mode=0o700, exist_ok=True)
+            self.html_cache_dir.mkdir(mode=0o700, exist_ok=True)
+        except OSError as e:
+            print(f"[!] Could not create cache folder: {e}")
+    
+    def prune_render_cache(self):
+        """Delete rendered Markdown that no page of this build used"""
+        used = self._used_render_keys.union(page['markdown_key'] for page in self.all_pages)
+        removed = 0
+        try:
+            with os.scandir(self.html_cache_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext == '.html' and stem not in used:
+                        os.unlink(entry.path)
+                        removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[!] Could not prune render cache: {e}")
+        if removed:
+            print(f"[*] Pruned {removed} unused render cache entries")
+    
+    def load_output_hashes(self) -> Dict[str, tuple]:
+        """Load output file hashes recorded by the previous build (empty if missing, unreadable or disabled)"""
+        if not self.use_cache:
+            return {}
+        try:
+            with open(self.output_hashes_file, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            return {path: (digest, tuple(stat_key), render_key)
+                    for path, (digest, stat_key, render_key) in records.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[!] Ignoring unreadable output hashes: {e}")
+            return {}
+    
+    def save_output_hashes(self):
+        """Persist output hashes keyed by file path -> [sha1 hex, [mtime_ns, size], render key]"""
+        if not self.use_cache:
+            return
+        cache_file = self.output_hashes_file
+        try:
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._written_outputs, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"[!] Could not write output hashes: {e}")
+    
+    def page_render_key(self, page: Dict[str, Any]) -> str:
+        """Hash everything a page's HTML is rendered from (build-wide inputs + its source hash)"""
+        return hashlib.sha1((self.page_render_signature + page['source_hash']).encode('utf-8')).hexdigest()
+    
+    def output_is_current(self, output_file: Path, render_key: str) -> bool:
+        """True if the previous build rendered this file from the same inputs and it is untouched since"""
+        key = str(output_file)
+        previous = self._previous_outputs.get(key)
+        if not previous or previous[2] != render_key:
+            return False
+        try:
+            st = output_file.stat()
+        except OSError:
+            return False
+        if (st.st_mtime_ns, st.st_size) != previous[1]:
+            return False
+        self._written_outputs[key] = previous
+        return True
+    
+    def write_output(self, output_file: Path, content: str, render_key: str = None):
+        """Write a generated file, unless the previous build left identical content in place"""
+        key = str(output_file)
+        # Encode once: the same bytes are hashed and written
+        data = content.encode('utf-8')
+        digest = hashlib.sha1(data).hexdigest()
+        previous = self._previous_outputs.get(key)
+        if previous and previous[0] == digest:
+            # Only trust the recorded hash if the file was not touched since it was written
+            try:
+                st = output_file.stat()
+                if (st.st_mtime_ns, st.st_size) == previous[1]:
+                    self._written_outputs[key] = (digest, previous[1], render_key)
+                    self._unchanged_outputs += 1
+                    return
+            except OSError:
+                pass
+        
+        # Write a temp file and rename it over the target: the write is atomic, and an
+        # output that is a hardlink to a template file is replaced instead of overwritten
+        tmp_file = output_file.with_name(f'.{output_file.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, output_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        st = output_file.stat()
+        self._written_outputs[key] = (digest, (st.st_mtime_ns, st.st_size), render_key)
+    
+    def process_markdown_files(self, md_files: List[Path], root_dir: Path) -> List[Dict[str, Any]]:
+        """Process markdown files, reusing cached page data for files unchanged since the last build"""
+        cache = self.load_page_cache(root_dir)
+        
+        # Cheap stat() check first: only re-parse files whose mtime or size changed
+        stat_keys = {}
+        results = {}
+        changed_files = []
+        for md_file in md_files:
+            try:
+                st = md_file.stat()
+                stat_keys[md_file] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stat_keys[md_file] = None
+            cached = cache.get(str(md_file))
+            if cached and cached[0] == stat_keys[md_file]:
+                results[md_file] = cached[1]
+            else:
+                changed_files.append(md_file)
+        
+        if len(changed_files) < len(md_files):
+            print(f"[*] Reusing cached data for {len(md_files) - len(changed_files)} unchanged files")
+        
+        for md_file, page_data in zip(changed_files, self.process_markdown_batch(changed_files, root_dir)):
+            results[md_file] = page_data
+        
+        entries = {
+            str(md_file): (stat_keys[md_file], page_data)
+            for md_file, page_data in results.items()
+            if page_data and stat_keys[md_file]
+        }
+        if changed_files or entries.keys() != cache.keys():
+            self.save_page_cache(root_dir, entries)
+        
+        return [results[md_file] for md_file in md_files]
+    
+    def process_markdown_batch(self, md_files: List[Path], root_dir: Path) -> List[Dict[str, Any]]:
+        """Process markdown files in parallel worker processes (results keep input order)"""
+        workers = os.cpu_count() or 1
+        # Spawning workers costs more than converting a handful of files serially
+        if workers > 1 and len(md_files) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(self.config, str(self.output_dir),
+                                                   self.project_dir)) as executor:
+                    return list(executor.map(_process_markdown_worker, md_files,
+                                             [root_dir] * len(md_files), chunksize=16))
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                print(f"[!] Parallel processing unavailable ({e}), processing files serially")
+        
+        return [self.process_markdown_file(md_file, root_dir) for md_file in md_files]
+    
     def scan_directory(self, content_dir: Path) -> List[Dict[str, Any]]:
         """Scan directory for markdown files and process them"""
         pages = []
@@ -534,39 +978,40 @@ Crawl-delay: 1
             return pages
         
         # Get exclusion list from config (supports legacy 'exclude_folders' key)
-        exclusions = self.config.get('paths', {}).get('exclusions', 
-            self.config.get('paths', {}).get('exclude_folders', [
-                '.trash', '.obsidian', '.git', '__pycache__', 'node_modules'
-            ])
-        )
-        
-        def is_valid_name(name: str) -> bool:
-            """Check if a name is valid (not just separators/special chars)"""
-            # Remove extension if present
-            name_without_ext = name.rsplit('.', 1)[0] if '.' in name else name
-            # Strip common separator characters
-            stripped = name_without_ext.strip('-_=. ')
-            # Must have at least some alphanumeric content
-            return bool(stripped) and any(c.isalnum() for c in stripped)
+        exclusions = frozenset(self.config.get('paths', {}).get('exclusions', 
+            self.config.get('paths', {}).get('exclude_folders', DEFAULT_EXCLUSIONS)
+        ))
+        
+        def walk(directory: str):
+            """Yield markdown DirEntry objects, pruning excluded and invalid folders"""
+            try:
+                entries = os.scandir(directory)
+            except PermissionError:
+                return  # Unreadable folder: skip it, as Path.rglob did
+            with entries:
+                for entry in entries:
+                    # Exclusions match both folder names and filenames
+                    if entry.name in exclusions:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip folders with invalid names (just separators)
+                        if is_valid_name(entry.name):
+                            yield from walk(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield entry
         
         # Find all markdown files, excluding specified folders
         md_files = []
-        for f in content_dir.rglob('*.md'):
-            if f.name == 'index.md':
-                continue
-            # Check if any parent folder is in exclusion list
-            if any(excluded in f.parts for excluded in exclusions):
+        for entry in walk(str(content_dir)):
+            if entry.name == 'index.md':
                 continue
             # Skip files with invalid names (just separators)
-            if not is_valid_name(f.stem):
-                continue
-            # Skip files in folders with invalid names
-            if any(not is_valid_name(part) for part in f.relative_to(content_dir).parts[:-1]):
+            if not is_valid_name(entry.name[:-3]):
                 continue
-            md_files.append(f)
+            md_files.append(Path(entry.path))
         
-        for md_file in sorted(md_files):
-            page_data = self.process_markdown_file(md_file, content_dir)
+        md_files.sort()
+        for page_data in self.process_markdown_files(md_files, content_dir):
             if page_data:
                 pages.append(page_data)
                 
@@ -579,7 +1024,15 @@ Crawl-delay: 1
         return pages
     
     def get_category_icon(self, category: str) -> str:
-        """Get FontAwesome icon class for a category."""
+        """Get FontAwesome icon class for a category (memoized)."""
+        icon = self._category_icons.get(category)
+        if icon is None:
+            icon = self.lookup_category_icon(category)
+            self._category_icons[category] = icon
+        return icon
+    
+    def lookup_category_icon(self, category: str) -> str:
+        """Resolve the FontAwesome icon class for a category from config and defaults."""
         config_icons = self.config.get('ui', {}).get('category_icons', {})
         
         category_lower = category.lower()
@@ -613,53 +1066,65 @@ Crawl-delay: 1
         return self.config.get('ui', {}).get('default_icon', 'fas fa-folder')
     
     def generate_navigation_html_for_depth(self, depth: int = 0) -> str:
-        """Generate hierarchical navigation HTML with collapsible categories (unlimited depth)."""
+        """Get navigation HTML with links relative to a page at the given folder depth."""
+        # The tree only depends on all_pages: render it once, then apply the link prefix
+        navigation_html = self._navigation_by_depth.get(depth)
+        if navigation_html is None:
+            if self._navigation_html is None:
+                self._navigation_html = self.render_navigation_html()
+            navigation_html = self._navigation_html.replace(NAV_PREFIX, '../' * depth)
+            self._navigation_by_depth[depth] = navigation_html
+        return navigation_html
+    
+    def render_navigation_html(self) -> str:
+        """Generate hierarchical navigation HTML with collapsible categories (unlimited depth).
+        
+        Links start with the NAV_PREFIX placeholder, replaced per depth by
+        generate_navigation_html_for_depth().
+        """
         
         # Check if bookmarks are enabled
         show_bookmarks = self.config.get('ui', {}).get('show_bookmarks', True)
         
+        # Sort pages by folder, then pinned first (by pin order), then by filename stem
+        # Stem sorting preserves number prefixes (01-overview before 02-osint)
+        pin_rank = {}
+        for i, stem in enumerate(self.pin_to_top):
+            pin_rank.setdefault(stem, i)
+        unpinned_rank = len(self.pin_to_top)
+        
+        def page_sort_key(page) -> tuple:
+            return (page['levels_raw'], pin_rank.get(page['stem'], unpinned_rank), page['stem'])
+        
+        def make_node(display_html: str = '') -> dict:
+            """Create a navigation tree node (escaped folder display name, subfolders, pages)."""
+            return {'display_html': display_html, 'children': {}, 'pages': []}
+        
         def build_tree(pages):
-            """Build a recursive tree structure from flat page list."""
-            tree = {}
+            """Build a recursive tree structure from a page list in page_sort_key order.
+            
+            Folders are created in sorted order and pages arrive already ordered,
+            so nodes need no further sorting when rendered.
+            """
+            root = make_node()
             for page in pages:
-                levels_raw = page['levels_raw']
-                levels = page['levels']
-                
-                if not levels_raw:
-                    # Root level page
-                    if '__pages__' not in tree:
-                        tree['__pages__'] = []
-                    tree['__pages__'].append(page)
-                else:
-                    # Navigate/create path in tree
-                    current = tree
-                    for i, level_raw in enumerate(levels_raw):
-                        if level_raw not in current:
-                            current[level_raw] = {
-                                '__display__': levels[i],
-                                '__pages__': [],
-                            }
-                        current = current[level_raw]
-                    current['__pages__'].append(page)
-            return tree
+                # Walk/create the folder path, then attach the page (root pages stay on root)
+                node = root
+                for level_raw, level_html in zip(page['levels_raw'], page['levels_html']):
+                    child = node['children'].get(level_raw)
+                    if child is None:
+                        child = node['children'][level_raw] = make_node(level_html)
+                    node = child
+                node['pages'].append(page)
+            return root
         
         def render_sublevel(node, parent_id, level_depth, url_prefix):
             """Recursively render a sublevel of navigation."""
             html_parts = []
             
-            # Get subfolders and pages
-            subfolders = {k: v for k, v in sorted(node.items()) if not k.startswith('__')}
-            
-            # Sort pages: pinned first (by pin order), then by filename stem
-            # Stem sorting preserves number prefixes (01-overview before 02-osint)
-            pin_list = self.pin_to_top
-            pages = sorted(node.get('__pages__', []), key=lambda p: (
-                pin_list.index(p['file_path'].stem) if p['file_path'].stem in pin_list else len(pin_list),
-                p['file_path'].stem
-            ))
-
-            for folder_raw, folder_data in subfolders.items():
-                folder_display = folder_data.get('__display__', folder_raw)
+            # Subfolders and pages are already in display order (see build_tree)
+            for folder_raw, folder_data in node['children'].items():
+                folder_display_html = folder_data['display_html']
                 folder_id = f"{parent_id}-{folder_raw.lower().replace(' ', '-').replace('&', 'and')}"
                 
                 # Choose styling based on depth
@@ -668,7 +1133,7 @@ Crawl-delay: 1
                     html_parts.append(f'''
                         <div class="nav-subcategory">
                             <button class="subcategory-header" data-category="{folder_id}">
-                                <span><i class="fas fa-folder-open"></i> {html.escape(folder_display)}</span>
+                                <span><i class="fas fa-folder-open"></i> {folder_display_html}</span>
                                 <i class="fas fa-chevron-right subcategory-chevron"></i>
                             </button>
                             <div class="subcategory-items" id="{folder_id}">''')
@@ -677,7 +1142,7 @@ Crawl-delay: 1
                     html_parts.append(f'''
                                 <div class="nav-level-deep" data-depth="{level_depth}">
                                     <button class="deep-header" data-category="{folder_id}">
-                                        <span><i class="fas fa-angle-right deep-chevron"></i> {html.escape(folder_display)}</span>
+                                        <span><i class="fas fa-angle-right deep-chevron"></i> {folder_display_html}</span>
                                     </button>
                                     <div class="deep-items" id="{folder_id}">''')
                 
@@ -695,37 +1160,31 @@ Crawl-delay: 1
                                 </div>''')
             
             # Render pages at this level
-            for page in pages:
+            for page in node['pages']:
                 page_url = url_prefix + page['url']
                 indent_class = f"nav-item-depth-{level_depth}" if level_depth > 0 else "nav-item"
                 bookmark_btn = f'<button class="bookmark-btn" data-page="{page["id"]}"><i class="far fa-bookmark"></i></button>' if show_bookmarks else ''
                 html_parts.append(f'''
                                 <a href="{page_url}" class="nav-item {indent_class}" data-page="{page['id']}">
-                                    <span class="nav-item-text">{html.escape(page['title'])}</span>
+                                    <span class="nav-item-text">{page['title_html']}</span>
                                     {bookmark_btn}
                                 </a>''')
             
             return ''.join(html_parts)
         
         # Build tree and generate HTML
-        tree = build_tree(self.all_pages)
-        prefix = '../' * depth if depth > 0 else ''
+        tree = build_tree(sorted(self.all_pages, key=page_sort_key))
+        prefix = NAV_PREFIX
         nav_html = []
         
         # Get top-level categories
-        categories = {k: v for k, v in sorted(tree.items()) if not k.startswith('__')}
+        categories = tree['children'].items()
         
         # Split root pages into pinned (display before categories) and unpinned (after)
-        pin_list = self.pin_to_top
-        all_root_pages = tree.get('__pages__', [])
-        pinned_pages = sorted(
-            [p for p in all_root_pages if p['file_path'].stem in pin_list],
-            key=lambda p: (pin_list.index(p['file_path'].stem), p['file_path'].stem)
-        )
-        unpinned_pages = sorted(
-            [p for p in all_root_pages if p['file_path'].stem not in pin_list],
-            key=lambda p: p['file_path'].stem
-        )
+        # (pinned pages already come first in page_sort_key order)
+        root_pages = tree['pages']
+        pinned_pages = [p for p in root_pages if p['stem'] in pin_rank]
+        unpinned_pages = [p for p in root_pages if p['stem'] not in pin_rank]
         
         # Render pinned root pages BEFORE categories
         for page in pinned_pages:
@@ -733,21 +1192,21 @@ Crawl-delay: 1
             bookmark_btn = f'<button class="bookmark-btn" data-page="{page["id"]}"><i class="far fa-bookmark"></i></button>' if show_bookmarks else ''
             nav_html.append(f'''
                 <a href="{page_url}" class="nav-item nav-item-pinned" data-page="{page['id']}">
-                    <span class="nav-item-text">{html.escape(page['title'])}</span>
+                    <span class="nav-item-text">{page['title_html']}</span>
                     {bookmark_btn}
                 </a>''')
         
-        for level1_raw, level1_data in categories.items():
+        for level1_raw, level1_data in categories:
             icon_class = self.get_category_icon(level1_raw)
             level1_id = level1_raw.lower().replace(' ', '-').replace('&', 'and')
-            level1_display = level1_data.get('__display__', level1_raw)
+            level1_display_html = level1_data['display_html']
             
             nav_html.append(f'''
                 <div class="nav-category">
                     <button class="category-header" data-category="{level1_id}">
                         <span>
                             <i class="{icon_class} category-icon"></i>
-                            {html.escape(level1_display)}
+                            {level1_display_html}
                         </span>
                         <i class="fas fa-chevron-right category-chevron"></i>
                     </button>
@@ -766,44 +1225,31 @@ Crawl-delay: 1
             bookmark_btn = f'<button class="bookmark-btn" data-page="{page["id"]}"><i class="far fa-bookmark"></i></button>' if show_bookmarks else ''
             nav_html.append(f'''
                 <a href="{page_url}" class="nav-item" data-page="{page['id']}">
-                    <span class="nav-item-text">{html.escape(page['title'])}</span>
+                    <span class="nav-item-text">{page['title_html']}</span>
                     {bookmark_btn}
                 </a>''')
         
         return ''.join(nav_html)
     
-    def escape_js_string(self, s: str) -> str:
-        """Escape a string for safe inclusion in JavaScript"""
-        if s is None:
-            return ''
-        return s.replace('\\', '\\\\').replace("'", "\\'").replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
-    
     def generate_page_data_js(self) -> str:
         """Generate JavaScript page data with full hierarchy info for breadcrumbs"""
-        js_data = "window.pageData = {\n"
-        for page in self.all_pages:
-            title_escaped = self.escape_js_string(page['title'])
-            category_escaped = self.escape_js_string(page['category'])
-            levels_escaped = [self.escape_js_string(l) for l in page['levels']]
-            levels_js = "[" + ", ".join(f"'{l}'" for l in levels_escaped) + "]"
-            
-            js_data += f"    '{page['id']}': {{\n"
-            js_data += f"        page: '{title_escaped}',\n"
-            js_data += f"        category: '{category_escaped}',\n"
-            js_data += f"        url: '{page['url']}',\n"
-            js_data += f"        levels: {levels_js},\n"
-            js_data += f"        reading_time: {page['reading_time']}\n"
-            js_data += "    },\n"
-        js_data += "};\n"
-        return js_data
+        # JSON is a valid JavaScript object literal, and json.dumps escapes every field
+        page_data = {
+            page['id']: {
+                'page': page['title'],
+                'category': page['category'],
+                'url': page['url'],
+                'levels': page['levels'],
+                'reading_time': page['reading_time'],
+            }
+            for page in self.all_pages
+        }
+        return f"window.pageData = {json.dumps(page_data, ensure_ascii=False, separators=(',', ':'))};\n"
     
     def generate_site_config_js(self) -> str:
         """Generate JavaScript configuration object"""
-        return f'''window.siteConfig = {{
-    siteName: '{self.escape_js_string(self.site_name)}',
-    siteUrl: '{self.escape_js_string(self.site_url)}'
-}};
-'''
+        site_config = {'siteName': self.site_name, 'siteUrl': self.site_url}
+        return f"window.siteConfig = {json.dumps(site_config, ensure_ascii=False, separators=(',', ':'))};\n"
     
     def generate_shared_data_file(self, site_config_js: str, page_data_js: str):
         """Generate shared site-data.js file containing config, page data, and navigation HTML.
@@ -812,10 +1258,7 @@ Crawl-delay: 1
         Instead, each page loads this single cached file via <script src>.
         """
         # Collect unique navigation HTML per depth level
-        depths = set()
-        for page in self.all_pages:
-            depth = len(page['relative_path'].parts) - 1
-            depths.add(depth)
+        depths = {page['depth'] for page in self.all_pages}
         depths.add(0)  # index + static pages always use depth 0
 
         nav_data_js = "window.navData = {\n"
@@ -829,8 +1272,7 @@ Crawl-delay: 1
 
         output_file = self.output_dir / 'assets' / 'js' / 'site-data.js'
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(shared_content)
+        self.write_output(output_file, shared_content)
         print(f"[+] Generated: {output_file} ({len(shared_content) // 1024}KB shared data)")
 
     def generate_recent_section(self) -> str:
@@ -892,7 +1334,7 @@ Crawl-delay: 1
             if custom_copyright:
                 copyright_text = custom_copyright.replace('{year}', str(current_year)).replace('{site_name}', self.site_name)
             else:
-                copyright_text = f"&copy; {current_year} {html.escape(self.site_name)}"
+                copyright_text = f"&copy; {current_year} {self.site_name_html}"
             
             if show_timestamp:
                 copyright_text += f". Generated on {generation_date}."
@@ -912,32 +1354,50 @@ Crawl-delay: 1
         
         return f'''<div class="footer-bottom">
             <div class="footer-bottom-content">
-                {chr(10).join(' ' * 16 + line for line in lines)}
+                {FOOTER_INDENT}{FOOTER_LINE_SEPARATOR.join(lines)}
             </div>
         </div>'''
     
     def generate_contribute_button(self, contribute_url: str) -> str:
         """Generate contribute button HTML if enabled in config"""
-        ui_config = self.config.get('ui', {})
-        show_contribute = ui_config.get('show_contribute', True)
-        if not show_contribute:
+        if not self.show_contribute:
             return ''
         
-        contribute_text = ui_config.get('contribute_text', 'Contribute')
         return f'''<a href="{contribute_url}" class="contribute-btn" id="contributeBtn">
                 <i class="fas fa-edit"></i>
-                <span class="contribute-text">{html.escape(contribute_text)}</span>
+                <span class="contribute-text">{self.contribute_text_html}</span>
             </a>'''
     
     def generate_contribute_footer_link(self, contribute_url: str) -> str:
         """Generate contribute footer link HTML if enabled in config"""
-        ui_config = self.config.get('ui', {})
-        show_contribute = ui_config.get('show_contribute', True)
-        if not show_contribute:
+        if not self.show_contribute:
             return ''
         
-        contribute_text = ui_config.get('contribute_text', 'Contribute')
-        return f'<li><a href="{contribute_url}">{html.escape(contribute_text)}</a></li>'
+        return f'<li><a href="{contribute_url}">{self.contribute_text_html}</a></li>'
+    
+    def get_depth_urls(self, depth: int) -> Dict[str, str]:
+        """Get relative asset/home/contribute/about URLs for a page at the given folder depth (memoized)"""
+        urls = self._depth_urls.get(depth)
+        if urls is None:
+            prefix = '../' * depth if depth > 0 else './'
+            urls = {
+                'assets_path': '../' * depth + 'assets/',
+                'home_url': prefix + 'index.html',
+                'contribute_url': prefix + 'contribute.html',
+                'about_url': prefix + 'about.html',
+            }
+            self._depth_urls[depth] = urls
+        return urls
+    
+    def get_contribute_html(self, depth: int = 0) -> tuple:
+        """Get (contribute button, footer link) HTML for a page at the given folder depth (memoized)"""
+        snippets = self._contribute_by_depth.get(depth)
+        if snippets is None:
+            contribute_url = self.get_depth_urls(depth)['contribute_url']
+            snippets = (self.generate_contribute_button(contribute_url),
+                        self.generate_contribute_footer_link(contribute_url))
+            self._contribute_by_depth[depth] = snippets
+        return snippets
     
     def load_index_md(self):
         """Load and convert index.md if it exists"""
@@ -945,34 +1405,28 @@ Crawl-delay: 1
         if not index_path.exists():
             return None
         
-        with open(index_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_markdown_file(index_path)
         
         if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                content = parts[2].strip()
+            end = content.find('---', 3)
+            if end != -1:
+                content = content[end + 3:].strip()
         
-        md = markdown.Markdown(extensions=['extra', 'fenced_code', 'tables'])
-        html_content = md.convert(content)
+        html_content = self.render_markdown(content)
         return f'<div class="article-content">{html_content}</div>'
 
     def generate_breadcrumb_html(self, page: Dict[str, Any], home_url: str, generation_date: str) -> str:
         """Generate breadcrumb HTML for a specific page (unlimited levels)"""
-        levels = page.get('levels', [])
-        
         # Build breadcrumb parts
         breadcrumb_parts = [f'''<a href="{home_url}" class="breadcrumb-home" data-page="welcome">
-                        <i class="fas fa-home"></i> {html.escape(self.site_name)}
+                        <i class="fas fa-home"></i> {self.site_name_html}
                     </a>''']
         
-        for i, level in enumerate(levels):
-            breadcrumb_parts.append(f'''<span class="breadcrumb-separator">›</span>
-                    <span class="breadcrumb-level" data-level="{i+1}">{html.escape(level)}</span>''')
+        for i, level_html in enumerate(page['levels_html'], 1):
+            breadcrumb_parts.append(f'{BREADCRUMB_SEPARATOR}<span class="breadcrumb-level" data-level="{i}">{level_html}</span>')
         
         # Add page title
-        breadcrumb_parts.append(f'''<span class="breadcrumb-separator">›</span>
-                    <span class="breadcrumb-page" id="breadcrumbPage">{html.escape(page['title'])}</span>''')
+        breadcrumb_parts.append(f'{BREADCRUMB_SEPARATOR}<span class="breadcrumb-page" id="breadcrumbPage">{page["title_html"]}</span>')
         
         breadcrumb_html = f'''<nav class="breadcrumb-nav">
                 <div class="breadcrumb" id="breadcrumb">
@@ -994,7 +1448,7 @@ Crawl-delay: 1
             breadcrumb = f'''<nav class="breadcrumb-nav">
                 <div class="breadcrumb" id="breadcrumb">
                     <span class="breadcrumb-home">
-                        <i class="fas fa-home"></i> {html.escape(self.site_name)}
+                        <i class="fas fa-home"></i> {self.site_name_html}
                     </span>
                 </div>
                 <div class="breadcrumb-meta" id="breadcrumbMeta">
@@ -1023,7 +1477,7 @@ Crawl-delay: 1
         return f'''<nav class="breadcrumb-nav">
             <div class="breadcrumb" id="breadcrumb">
                 <span class="breadcrumb-home">
-                    <i class="fas fa-home"></i> {html.escape(self.site_name)}
+                    <i class="fas fa-home"></i> {self.site_name_html}
                 </span>
             </div>
             <div class="breadcrumb-meta" id="breadcrumbMeta">
@@ -1034,10 +1488,10 @@ Crawl-delay: 1
             <div class="welcome-section">
                 <h1 class="welcome-title">
                     <span class="title-icon"><i class="fas fa-book-open"></i></span>
-                    Welcome to {html.escape(self.site_name)}
+                    Welcome to {self.site_name_html}
                 </h1>
                 <p class="welcome-description">
-                    {html.escape(self.description)}. Browse {page_count} articles across {category_count} categories.
+                    {self.description_html}. Browse {page_count} articles across {category_count} categories.
                 </p>
 
                 <div class="welcome-cards">
@@ -1050,63 +1504,54 @@ Crawl-delay: 1
             </div>
         </div>'''
     
-    def generate_index(self, template: str, navigation_html: str, site_config_js: str, 
-                       page_data_js: str, generation_date: str, current_year: int, site_name_initial: str):
+    def generate_index(self, template_parts: List[str], navigation_html: str, site_config_js: str, 
+                       page_data_js: str, generation_date: str, current_year: int, site_name_initial: str,
+                       shared_replacements: Dict[str, str]):
         """Generate index.html"""
         index_content = self.generate_index_content(generation_date)
         
         seo_replacements = self.get_seo_replacements(None, 'index', '', 'assets/')
+        contribute_button, contribute_footer_link = self.get_contribute_html(0)
         
-        index_html = template
-        replacements = {
-            '{{SITE_NAME}}': self.site_name,
-            '{{SITE_DESCRIPTION}}': self.description,
-            '{{NAVIGATION_HTML}}': '',
+        replacements = shared_replacements | {
             '{{DYNAMIC_PAGE_DATA}}': "window.currentPageId = 'welcome'; window.pageDepth = 0;",
-            '{{GENERATION_DATE}}': generation_date,
-            '{{CURRENT_YEAR}}': str(current_year),
-            '{{SITE_NAME_INITIAL}}': site_name_initial,
             '{{DYNAMIC_CONTENT_PLACEHOLDER}}': index_content,
-            '{{TOTAL_PAGES}}': str(len(self.all_pages)),
-            '{{TOTAL_CATEGORIES}}': str(len([c for c in self.categories if c != 'General'])),
             '{{HOME_URL}}': './index.html',
             '{{ASSETS_PATH}}': 'assets/',
-            '{{CONTRIBUTE_URL}}': self.config.get('ui', {}).get('contribute_url', './contribute.html'),
-            '{{CONTRIBUTE_BUTTON}}': self.generate_contribute_button('./contribute.html'),
-            '{{CONTRIBUTE_FOOTER_LINK}}': self.generate_contribute_footer_link('./contribute.html'),
+            '{{CONTRIBUTE_URL}}': self.contribute_url,
+            '{{CONTRIBUTE_BUTTON}}': contribute_button,
+            '{{CONTRIBUTE_FOOTER_LINK}}': contribute_footer_link,
             '{{ABOUT_URL}}': './about.html',
-            '{{GITHUB_URL}}': self.config.get('site', {}).get('github_url', '#'),
-            '{{RECENT_SECTION}}': self.generate_recent_section(),
-            '{{BOOKMARKS_SECTION}}': self.generate_bookmarks_section(),
-            '{{FOOTER_BOTTOM}}': self.generate_footer_bottom(generation_date, current_year),
-            **seo_replacements
-        }
+        } | seo_replacements
 
-        for placeholder, replacement in replacements.items():
-            index_html = index_html.replace(placeholder, replacement)
+        # index.md may use the site-wide placeholders (e.g. {{TOTAL_PAGES}}) in its content
+        replacements['{{DYNAMIC_CONTENT_PLACEHOLDER}}'] = fill_template(split_template(index_content), replacements)
+        index_html = fill_template(template_parts, replacements)
 
         # Replace per-category article counts: {{CATEGORY_COUNT:category_name}}
         for cat_name, cat_pages in self.categories.items():
             index_html = index_html.replace(f'{{{{CATEGORY_COUNT:{cat_name}}}}}', str(len(cat_pages)))
 
         output_file = self.output_dir / 'index.html'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(index_html)
+        self.write_output(output_file, index_html)
         
         print(f"[+] Generated: {output_file}")
     
-    def generate_page(self, page: Dict[str, Any], template: str, site_config_js: str, 
-                      page_data_js: str, generation_date: str, current_year: int, site_name_initial: str):
-        """Generate individual HTML page"""
-        relative_parts = page['relative_path'].parts
-        depth = len(relative_parts) - 1
+    def generate_page(self, page: Dict[str, Any], template_parts: List[str], site_config_js: str, 
+                      page_data_js: str, generation_date: str, current_year: int, site_name_initial: str,
+                      shared_replacements: Dict[str, str]):
+        """Generate individual HTML page (skipped when its inputs match the previous build)"""
+        output_path = self.output_dir / page['url']
+        render_key = self.page_render_key(page)
+        if self.output_is_current(output_path, render_key):
+            self._unchanged_outputs += 1
+            return
         
-        assets_path = '../' * depth + 'assets/' if depth > 0 else 'assets/'
-        home_url = '../' * depth + 'index.html' if depth > 0 else './index.html'
-        contribute_url = '../' * depth + 'contribute.html' if depth > 0 else './contribute.html'
-        about_url = '../' * depth + 'about.html' if depth > 0 else './about.html'
+        depth = page['depth']
+        urls = self.get_depth_urls(depth)
+        assets_path = urls['assets_path']
         
-        breadcrumb_html = self.generate_breadcrumb_html(page, home_url, generation_date)
+        breadcrumb_html = self.generate_breadcrumb_html(page, urls['home_url'], generation_date)
 
         page_content = f'''
             {breadcrumb_html}
@@ -1116,40 +1561,24 @@ Crawl-delay: 1
         '''
 
         seo_replacements = self.get_seo_replacements(page, 'content', page['url'], assets_path)
+        contribute_button, contribute_footer_link = self.get_contribute_html(depth)
 
-        page_html = template
-        replacements = {
-            '{{SITE_NAME}}': self.site_name,
-            '{{SITE_DESCRIPTION}}': self.description,
-            '{{NAVIGATION_HTML}}': '',
+        replacements = shared_replacements | {
             '{{DYNAMIC_PAGE_DATA}}': f"window.currentPageId = '{page['id']}'; window.pageDepth = {depth};",
-            '{{GENERATION_DATE}}': generation_date,
-            '{{CURRENT_YEAR}}': str(current_year),
-            '{{SITE_NAME_INITIAL}}': site_name_initial,
             '{{DYNAMIC_CONTENT_PLACEHOLDER}}': page_content,
-            '{{TOTAL_PAGES}}': str(len(self.all_pages)),
-            '{{TOTAL_CATEGORIES}}': str(len([c for c in self.categories if c != 'General'])),
-            '{{HOME_URL}}': home_url,
+            '{{HOME_URL}}': urls['home_url'],
             '{{ASSETS_PATH}}': assets_path,
-            '{{CONTRIBUTE_URL}}': contribute_url,
-            '{{CONTRIBUTE_BUTTON}}': self.generate_contribute_button(contribute_url),
-            '{{CONTRIBUTE_FOOTER_LINK}}': self.generate_contribute_footer_link(contribute_url),
-            '{{ABOUT_URL}}': about_url,
-            '{{GITHUB_URL}}': self.config.get('site', {}).get('github_url', '#'),
-            '{{RECENT_SECTION}}': self.generate_recent_section(),
-            '{{BOOKMARKS_SECTION}}': self.generate_bookmarks_section(),
-            '{{FOOTER_BOTTOM}}': self.generate_footer_bottom(generation_date, current_year),
-            **seo_replacements
-        }
+            '{{CONTRIBUTE_URL}}': urls['contribute_url'],
+            '{{CONTRIBUTE_BUTTON}}': contribute_button,
+            '{{CONTRIBUTE_FOOTER_LINK}}': contribute_footer_link,
+            '{{ABOUT_URL}}': urls['about_url'],
+        } | seo_replacements
 
-        for placeholder, replacement in replacements.items():
-            page_html = page_html.replace(placeholder, replacement)
+        page_html = fill_template(template_parts, replacements)
         
-        output_path = self.output_dir / page['url']
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(page_html)
+        self.write_output(output_path, page_html, render_key)
 
         print(f"[+] Generated: {output_path}")
 
@@ -1162,23 +1591,24 @@ Crawl-delay: 1
         css_dest = assets_dir / 'css'
         css_dest.mkdir(exist_ok=True)
         if css_file.exists():
-            shutil.copy2(css_file, css_dest / 'style.css')
+            copy_asset(css_file, css_dest / 'style.css')
             print(f"[+] Copied: {css_file} -> assets/css/style.css")
         
         # Copy JS
         js_dest = assets_dir / 'js'
         js_dest.mkdir(exist_ok=True)
         if js_file.exists():
-            shutil.copy2(js_file, js_dest / 'app.js')
+            copy_asset(js_file, js_dest / 'app.js')
             print(f"[+] Copied: {js_file} -> assets/js/app.js")
         
         # Copy additional JS files (e.g., prism-custom.js)
         js_src_dir = template_dir / 'js'
         if js_src_dir.exists():
-            for extra_js in js_src_dir.iterdir():
-                if extra_js.is_file() and extra_js.suffix == '.js' and extra_js.name != 'app.js':
-                    shutil.copy2(extra_js, js_dest / extra_js.name)
-                    print(f"[+] Copied: {extra_js.name} -> assets/js/{extra_js.name}")
+            with os.scandir(js_src_dir) as entries:
+                for entry in entries:
+                    if os.path.splitext(entry.name)[1] == '.js' and entry.name != 'app.js' and entry.is_file():
+                        copy_asset(Path(entry.path), js_dest / entry.name)
+                        print(f"[+] Copied: {entry.name} -> assets/js/{entry.name}")
         
         # Copy images
         img_src = template_dir / 'img'
@@ -1186,10 +1616,11 @@ Crawl-delay: 1
             img_dest = assets_dir / 'img'
             img_dest.mkdir(exist_ok=True)
             img_count = 0
-            for img_file in img_src.iterdir():
-                if img_file.is_file():
-                    shutil.copy2(img_file, img_dest / img_file.name)
-                    img_count += 1
+            with os.scandir(img_src) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        copy_asset(Path(entry.path), img_dest / entry.name)
+                        img_count += 1
             if img_count > 0:
                 print(f"[+] Copied: {img_count} images -> assets/img/")
 
@@ -1203,7 +1634,21 @@ Crawl-delay: 1
         print("[*] Generating documentation site...")
 
         self.content_dir = content_dir
+        self.build_time = datetime.now()
+        self.prepare_config()
+        if self.use_cache:
+            self.create_cache_dir()
+        self._display_names = {}  # Config may have changed since the last build
+        self._category_icons = {}
         self.all_pages = self.scan_directory(content_dir)
+        self._navigation_html = None
+        self._navigation_by_depth = {}
+        self._depth_urls = {}
+        self._contribute_by_depth = {}
+        self._used_render_keys = set()
+        self._previous_outputs = self.load_output_hashes()
+        self._written_outputs = {}
+        self._unchanged_outputs = 0
         
         if not self.all_pages:
             print("[!] No markdown files found!")
@@ -1217,66 +1662,95 @@ Crawl-delay: 1
         self.setup_assets(template_path.parent, css_file, js_file)
         
         template = self.load_template(template_path)
+        self.template_uses_json_ld = '{{JSON_LD}}' in template
+        template_parts = split_template(template)
         
         site_config_js = self.generate_site_config_js()
         page_data_js = self.generate_page_data_js()
-        generation_date = datetime.now().strftime('%B %d, %Y')
-        current_year = datetime.now().year
+        generation_date = self.build_time.strftime('%B %d, %Y')
+        current_year = self.build_time.year
         site_name_initial = self.site_name[0].upper() if self.site_name else 'D'
+        
+        # Page-independent replacements: built once, shared by every page
+        shared_replacements = {
+            '{{SITE_NAME}}': self.site_name,
+            '{{SITE_DESCRIPTION}}': self.description,
+            '{{NAVIGATION_HTML}}': '',
+            '{{GENERATION_DATE}}': generation_date,
+            '{{CURRENT_YEAR}}': str(current_year),
+            '{{SITE_NAME_INITIAL}}': site_name_initial,
+            '{{TOTAL_PAGES}}': str(len(self.all_pages)),
+            '{{TOTAL_CATEGORIES}}': str(len([c for c in self.categories if c != 'General'])),
+            '{{GITHUB_URL}}': self.github_url,
+            '{{RECENT_SECTION}}': self.generate_recent_section(),
+            '{{BOOKMARKS_SECTION}}': self.generate_bookmarks_section(),
+            '{{FOOTER_BOTTOM}}': self.generate_footer_bottom(generation_date, current_year),
+        }
+        
+        # Build-wide inputs of every content page: generator code, template, shared values and config
+        self.page_render_signature = json.dumps(
+            [self.generator_hash, self.render_signature,
+             template, shared_replacements,
+             self.site_name, self.description, self.site_url, self.config],
+            sort_keys=True, default=str, ensure_ascii=False)
 
         # Generate shared data file (site config + page data + navigation per depth)
         self.generate_shared_data_file(site_config_js, page_data_js)
 
         navigation_html_index = self.generate_navigation_html_for_depth(0)
-        self.generate_index(template, navigation_html_index, site_config_js, page_data_js,
-                           generation_date, current_year, site_name_initial)
+        self.generate_index(template_parts, navigation_html_index, site_config_js, page_data_js,
+                           generation_date, current_year, site_name_initial, shared_replacements)
 
         for page in self.all_pages:
-            self.generate_page(page, template, site_config_js, page_data_js,
-                              generation_date, current_year, site_name_initial)
+            self.generate_page(page, template_parts, site_config_js, page_data_js,
+                              generation_date, current_year, site_name_initial, shared_replacements)
 
         pages_folder = self.config.get('paths', {}).get('pages_folder', 'input/pages')
         pages_dir = Path(pages_folder)
         if pages_dir.exists():
-            self.generate_static_pages(pages_dir, template, navigation_html_index, site_config_js,
-                                       page_data_js, generation_date, current_year, site_name_initial)
+            self.generate_static_pages(pages_dir, template_parts, navigation_html_index, site_config_js,
+                                       page_data_js, generation_date, current_year, site_name_initial,
+                                       shared_replacements)
         
         if self.config.get('generator', {}).get('generate_sitemap', True):
-            sitemap_content = self.generate_sitemap()
             sitemap_path = self.output_dir / 'sitemap.xml'
             with open(sitemap_path, 'w', encoding='utf-8') as f:
-                f.write(sitemap_content)
+                self.write_sitemap(f)
             print(f"[+] Generated: {sitemap_path}")
         
         robots_content = self.generate_robots_txt()
         robots_path = self.output_dir / 'robots.txt'
-        with open(robots_path, 'w', encoding='utf-8') as f:
-            f.write(robots_content)
+        self.write_output(robots_path, robots_content)
         print(f"[+] Generated: {robots_path}")
         
+        self.save_output_hashes()
+        if self.use_cache:
+            self.prune_render_cache()
+        if self._unchanged_outputs:
+            print(f"[*] Left {self._unchanged_outputs} unchanged files in place")
+        
         print(f"[+] Site generated successfully!")
         print(f"[*] Output: {self.output_dir}")
 
-    def generate_static_pages(self, pages_dir: Path, template: str, navigation_html: str, 
+    def generate_static_pages(self, pages_dir: Path, template_parts: List[str], navigation_html: str, 
                               site_config_js: str, page_data_js: str, generation_date: str, 
-                              current_year: int, site_name_initial: str):
+                              current_year: int, site_name_initial: str, shared_replacements: Dict[str, str]):
         """Generate static pages (about, contribute, etc.) at root level"""
         md_files = list(pages_dir.glob('*.md'))
         
         for md_file in md_files:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_markdown_file(md_file)
             
             frontmatter, markdown_content = self.parse_frontmatter(content)
             
-            html_content = self.md.convert(markdown_content)
+            html_content = self.render_markdown(markdown_content)
             
             title = frontmatter.get('title', md_file.stem.replace('-', ' ').title())
             
             breadcrumb_html = f'''<nav class="breadcrumb-nav">
                 <div class="breadcrumb" id="breadcrumb">
                     <a href="./index.html" class="breadcrumb-home" data-page="welcome">
-                        <i class="fas fa-home"></i> {html.escape(self.site_name)}
+                        <i class="fas fa-home"></i> {self.site_name_html}
                     </a>
                     <span class="breadcrumb-separator">›</span>
                     <span class="breadcrumb-category" id="breadcrumbCategory">{html.escape(title)}</span>
@@ -1302,42 +1776,48 @@ Crawl-delay: 1
             
             page_url = f"{md_file.stem}.html"
             seo_replacements = self.get_seo_replacements(static_page_data, 'static', page_url, 'assets/')
+            contribute_button, contribute_footer_link = self.get_contribute_html(0)
             
-            page_html = template
-            replacements = {
-                '{{SITE_NAME}}': self.site_name,
-                '{{SITE_DESCRIPTION}}': self.description,
-                '{{NAVIGATION_HTML}}': '',
+            replacements = shared_replacements | {
                 '{{DYNAMIC_PAGE_DATA}}': f"window.currentPageId = '{md_file.stem}'; window.pageDepth = 0;",
-                '{{GENERATION_DATE}}': generation_date,
-                '{{CURRENT_YEAR}}': str(current_year),
-                '{{SITE_NAME_INITIAL}}': site_name_initial,
                 '{{DYNAMIC_CONTENT_PLACEHOLDER}}': page_content,
-                '{{TOTAL_PAGES}}': str(len(self.all_pages)),
-                '{{TOTAL_CATEGORIES}}': str(len([c for c in self.categories if c != 'General'])),
                 '{{HOME_URL}}': './index.html',
                 '{{ASSETS_PATH}}': 'assets/',
                 '{{CONTRIBUTE_URL}}': './contribute.html',
-                '{{CONTRIBUTE_BUTTON}}': self.generate_contribute_button('./contribute.html'),
-                '{{CONTRIBUTE_FOOTER_LINK}}': self.generate_contribute_footer_link('./contribute.html'),
+                '{{CONTRIBUTE_BUTTON}}': contribute_button,
+                '{{CONTRIBUTE_FOOTER_LINK}}': contribute_footer_link,
                 '{{ABOUT_URL}}': './about.html',
-                '{{GITHUB_URL}}': self.config.get('site', {}).get('github_url', '#'),
-                '{{RECENT_SECTION}}': self.generate_recent_section(),
-                '{{BOOKMARKS_SECTION}}': self.generate_bookmarks_section(),
-                '{{FOOTER_BOTTOM}}': self.generate_footer_bottom(generation_date, current_year),
-                **seo_replacements
-            }
+            } | seo_replacements
 
-            for placeholder, replacement in replacements.items():
-                page_html = page_html.replace(placeholder, replacement)
+            page_html = fill_template(template_parts, replacements)
 
             output_file = self.output_dir / f"{md_file.stem}.html"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(page_html)
+            self.write_output(output_file, page_html)
             
             print(f"[+] Generated: {output_file}")
 
 
+# =============================================================================
+# PARALLEL PROCESSING
+# =============================================================================
+
+# Per-process converter, created once by _init_worker in each worker process
+_worker_converter = None
+
+
+def _init_worker(config: dict, output_dir: str, project_dir: Optional[Path]):
+    """Initialize a worker process with its own converter and Markdown instance"""
+    global _worker_converter
+    _worker_converter = MarkdownToHtmlConverter(output_dir=output_dir, project_dir=project_dir)
+    _worker_converter.config = config
+    _worker_converter.prepare_config()
+
+
+def _process_markdown_worker(file_path: Path, root_dir: Path) -> Optional[Dict[str, Any]]:
+    """Process a single markdown file in a worker process (module-level so it can be pickled)"""
+    return _worker_converter.process_markdown_file(file_path, root_dir)
+
+
 def load_config(config_path: str = 'config.json') -> dict:
     """Load configuration from JSON file"""
     if not Path(config_path).exists():
@@ -1381,7 +1861,9 @@ def main():
     css_file = template_base / 'css' / 'style.css'
     js_file = template_base / 'js' / 'app.js'
     
-    converter = MarkdownToHtmlConverter(site_name, description, output_dir)
+    # Build caches belong to the project the config file lives in
+    converter = MarkdownToHtmlConverter(site_name, description, output_dir,
+                                        project_dir=Path(args.config).resolve().parent)
     converter.site_url = config.get('site', {}).get('url', '')
     converter.config = config
     